@@ -4,20 +4,29 @@ Serveur de streaming audio WebRTC pour le système d'écoute commercial/admin
 Utilise aiortc pour WebRTC et socketio pour la signalisation
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import logging
 import uuid
 import os
-from typing import Dict, Set
+import signal
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Set
 import aiohttp
 from aiohttp import web, WSMsgType
 import socketio
-from aiortc import RTCPeerConnection, RTCSessionDescription, MediaStreamTrack
-from aiortc.contrib.media import MediaRelay
 import ssl
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from aiortc import RTCPeerConnection, MediaStreamTrack
+
+# Fin des imports de module, point de départ de la mesure du temps jusqu'à "prêt"
+# (le démarrage de l'interpréteur et les imports ci-dessus n'y sont pas inclus)
+MODULE_LOADED_AT = time.perf_counter()
+
 # Charger les variables d'environnement
 load_dotenv()
 
@@ -25,6 +34,108 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Répertoire des certificats partagés avec le serveur Vite
+DEFAULT_SSL_DIR = os.path.join(os.path.dirname(__file__), '..', 'ssl')
+
+
+class TLSHandshakeStats:
+    """Compteurs des handshakes TLS (complets vs reprises de session) et de leur latence"""
+
+    def __init__(self):
+        self.full_handshakes = 0
+        self.resumed_handshakes = 0
+        self.failed_handshakes = 0
+        self.full_latency_total = 0.0
+        self.resumed_latency_total = 0.0
+        self.max_latency = 0.0
+        self.certificate_reloads = 0
+        self.last_certificate_reload = None
+
+    def record(self, latency: float, resumed: bool):
+        if resumed:
+            self.resumed_handshakes += 1
+            self.resumed_latency_total += latency
+        else:
+            self.full_handshakes += 1
+            self.full_latency_total += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def record_failure(self):
+        self.failed_handshakes += 1
+
+    def snapshot(self) -> dict:
+        total = self.full_handshakes + self.resumed_handshakes
+
+        def average_ms(latency_total, count):
+            return round(latency_total / count * 1000, 2) if count else None
+
+        return {
+            'full_handshakes': self.full_handshakes,
+            'resumed_handshakes': self.resumed_handshakes,
+            'failed_handshakes': self.failed_handshakes,
+            'resumption_ratio': round(self.resumed_handshakes / total, 3) if total else None,
+            'avg_full_handshake_ms': average_ms(self.full_latency_total, self.full_handshakes),
+            'avg_resumed_handshake_ms': average_ms(self.resumed_latency_total, self.resumed_handshakes),
+            'max_handshake_ms': round(self.max_latency * 1000, 2),
+            'certificate_reloads': self.certificate_reloads,
+            'last_certificate_reload': self.last_certificate_reload
+        }
+
+
+tls_stats = TLSHandshakeStats()
+
+
+class TrackedSSLObject(ssl.SSLObject):
+    """SSLObject qui mesure la durée du handshake et détecte les reprises de session.
+
+    asyncio (et uvloop) appellent do_handshake() à chaque arrivée de données
+    tant que le handshake n'est pas terminé : le premier appel date le début.
+    """
+
+    _handshake_started = None
+
+    def do_handshake(self):
+        if self._handshake_started is None:
+            self._handshake_started = time.perf_counter()
+        try:
+            super().do_handshake()
+        except (ssl.SSLWantReadError, ssl.SSLWantWriteError):
+            raise
+        except Exception:
+            tls_stats.record_failure()
+            raise
+        tls_stats.record(time.perf_counter() - self._handshake_started, self.session_reused)
+
+
+# aiortc (et av, pylibsrtp, ...) est l'import le plus lourd du serveur : il est
+# différé jusqu'à la première offre WebRTC pour accélérer le démarrage
+_aiortc = None
+
+
+def load_aiortc():
+    """Importer aiortc à la première utilisation"""
+    global _aiortc
+    if _aiortc is None:
+        started = time.perf_counter()
+        import aiortc
+        import aiortc.contrib.media
+        _aiortc = aiortc
+        logger.info(f"📦 aiortc chargé en {(time.perf_counter() - started) * 1000:.0f} ms")
+    return _aiortc
+
+
+def install_event_loop():
+    """Activer uvloop si USE_UVLOOP est positionné, sinon garder la boucle asyncio standard"""
+    if os.getenv('USE_UVLOOP', '').lower() not in ('1', 'true', 'yes'):
+        return
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("⚠️  uvloop non installé, utilisation de la boucle asyncio standard")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 class AudioStreamingServer:
     def __init__(self):
         # Récupérer l'adresse du client depuis les variables d'environnement
@@ -52,10 +163,23 @@ class AudioStreamingServer:
         self.commercial_connections: Dict[str, RTCPeerConnection] = {}
         self.admin_listeners: Dict[str, Set[str]] = {}  # commercial_id -> set of admin_session_ids
         self.session_to_user: Dict[str, dict] = {}  # session_id -> user_info
-        self.media_relay = MediaRelay()
+        self._media_relay = None
         self.commercial_audio_tracks: Dict[str, any] = {}  # commercial_id -> audio_track
         self.admin_connections: Dict[str, RTCPeerConnection] = {}  # admin_session_id -> RTCPeerConnection
         
+        # Configuration TLS (chemins surchargeables par variables d'environnement)
+        self.ssl_context: Optional[ssl.SSLContext] = None  # contexte d'écoute (tickets, sessions)
+        self.certificate_context: Optional[ssl.SSLContext] = None  # certificat servi, remplacé à chaque rechargement
+        self.ssl_cert_path = os.getenv('SSL_CERT_PATH', os.path.join(DEFAULT_SSL_DIR, '192.168.1.50.pem'))
+        self.ssl_key_path = os.getenv('SSL_KEY_PATH', os.path.join(DEFAULT_SSL_DIR, '192.168.1.50-key.pem'))
+        self.ssl_cert_mtimes = None
+        self.certificate_watcher: Optional[asyncio.Task] = None
+        
+        # Passe à True à la réception de SIGTERM/SIGINT : plus aucune nouvelle session acceptée
+        self.draining = False
+        # Rester sous le délai SIGTERM -> SIGKILL de Docker (10 s par défaut)
+        self.shutdown_timeout = float(os.getenv('SHUTDOWN_TIMEOUT', '8'))
+        
         # Gestionnaires d'événements Socket.IO
         self.sio.on('connect', self.on_connect)
         self.sio.on('disconnect', self.on_disconnect)
@@ -69,6 +193,30 @@ class AudioStreamingServer:
         self.sio.on('webrtc_ice_candidate', self.on_webrtc_ice_candidate)
         self.sio.on('webrtc_ice_candidate_from_admin', self.on_webrtc_ice_candidate_from_admin)
 
+    @property
+    def media_relay(self):
+        """MediaRelay partagé, créé au premier besoin (import différé d'aiortc)"""
+        if self._media_relay is None:
+            self._media_relay = load_aiortc().contrib.media.MediaRelay()
+        return self._media_relay
+
+    async def reject_if_draining(self, sid) -> bool:
+        """Refuser une nouvelle session pendant l'arrêt du serveur"""
+        if not self.draining:
+            return False
+        await self.sio.emit('error', {'message': 'Serveur en cours d\'arrêt, veuillez vous reconnecter'}, room=sid)
+        return True
+
+    async def discard_if_draining(self, sid, pc, connections: Dict[str, RTCPeerConnection]) -> bool:
+        """Fermer une connexion WebRTC en cours de négociation si l'arrêt a commencé entre-temps"""
+        if not self.draining:
+            return False
+        if connections.get(sid) is pc:
+            del connections[sid]
+        await pc.close()
+        logger.info(f"Connexion WebRTC de {sid} fermée : arrêt du serveur en cours")
+        return True
+
     def setup_cors_middleware(self):
         """Configure CORS middleware pour les requêtes HTTP"""
         @web.middleware
@@ -117,6 +265,9 @@ class AudioStreamingServer:
 
     async def on_connect(self, sid, environ):
         """Connexion d'un client"""
+        if self.draining:
+            logger.info(f"Connexion refusée pendant l'arrêt: {sid}")
+            return False
         logger.info(f"Client connecté: {sid}")
         return True
 
@@ -125,9 +276,9 @@ class AudioStreamingServer:
         logger.info(f"Client déconnecté: {sid}")
         
         # Nettoyer les connexions WebRTC
-        if sid in self.commercial_connections:
-            await self.commercial_connections[sid].close()
-            del self.commercial_connections[sid]
+        pc = self.commercial_connections.pop(sid, None)
+        if pc:
+            await pc.close()
         
         # Nettoyer les listeners admin
         user_info = self.session_to_user.get(sid)
@@ -152,6 +303,9 @@ class AudioStreamingServer:
                 await self.sio.emit('error', {'message': 'commercial_id requis'}, room=sid)
                 return
             
+            if await self.reject_if_draining(sid):
+                return
+            
             # Enregistrer l'admin comme listener
             if commercial_id not in self.admin_listeners:
                 self.admin_listeners[commercial_id] = set()
@@ -215,6 +369,9 @@ class AudioStreamingServer:
                 await self.sio.emit('error', {'message': 'commercial_id requis'}, room=sid)
                 return
             
+            if await self.reject_if_draining(sid):
+                return
+            
             # Enregistrer le commercial
             self.session_to_user[sid] = {
                 'role': 'commercial',
@@ -250,9 +407,9 @@ class AudioStreamingServer:
             commercial_id = user_info['commercial_id']
             
             # Fermer la connexion WebRTC
-            if sid in self.commercial_connections:
-                await self.commercial_connections[sid].close()
-                del self.commercial_connections[sid]
+            pc = self.commercial_connections.pop(sid, None)
+            if pc:
+                await pc.close()
             
             # Notifier les admins qui écoutent
             if commercial_id in self.admin_listeners:
@@ -281,10 +438,18 @@ class AudioStreamingServer:
                 await self.sio.emit('error', {'message': 'SDP requis'}, room=sid)
                 return
             
+            if await self.reject_if_draining(sid):
+                return
+            
             logger.info(f"🎤 Traitement de l'offre WebRTC du commercial {commercial_id}")
             
+            # Premier import d'aiortc dans un thread pour ne pas bloquer la boucle
+            aiortc = await asyncio.to_thread(load_aiortc)
+            if await self.reject_if_draining(sid):
+                return
+            
             # Créer une nouvelle connexion WebRTC
-            pc = RTCPeerConnection()
+            pc = aiortc.RTCPeerConnection()
             self.commercial_connections[sid] = pc
             
             # Gestionnaire pour les pistes audio reçues
@@ -302,14 +467,18 @@ class AudioStreamingServer:
                 self.commercial_audio_tracks = {}
             
             # Définir la description de l'offre
-            await pc.setRemoteDescription(RTCSessionDescription(
+            await pc.setRemoteDescription(aiortc.RTCSessionDescription(
                 sdp=offer_sdp['sdp'],
                 type=offer_sdp['type']
             ))
+            if await self.discard_if_draining(sid, pc, self.commercial_connections):
+                return
             
             # Créer une réponse
             answer = await pc.createAnswer()
             await pc.setLocalDescription(answer)
+            if await self.discard_if_draining(sid, pc, self.commercial_connections):
+                return
             
             # Envoyer la réponse au commercial
             await self.sio.emit('webrtc_answer', {
@@ -345,7 +514,7 @@ class AudioStreamingServer:
                 logger.error("SDP manquant dans la réponse de l'admin")
                 return
             
-            await pc.setRemoteDescription(RTCSessionDescription(
+            await pc.setRemoteDescription(load_aiortc().RTCSessionDescription(
                 sdp=answer_sdp['sdp'],
                 type=answer_sdp['type']
             ))
@@ -422,6 +591,10 @@ class AudioStreamingServer:
     async def setup_admin_webrtc_connection(self, admin_sid: str, commercial_id: str):
         """Configurer une connexion WebRTC pour un admin"""
         try:
+            if self.draining:
+                logger.info(f"Arrêt en cours, pas de connexion WebRTC pour l'admin {admin_sid}")
+                return
+            
             # Vérifier qu'on a bien une piste audio pour ce commercial
             if commercial_id not in self.commercial_audio_tracks:
                 logger.warning(f"Aucune piste audio disponible pour le commercial {commercial_id}")
@@ -430,7 +603,7 @@ class AudioStreamingServer:
             audio_track = self.commercial_audio_tracks[commercial_id]
             
             # Créer une connexion WebRTC pour cet admin
-            pc = RTCPeerConnection()
+            pc = load_aiortc().RTCPeerConnection()
             self.admin_connections[admin_sid] = pc
             
             # Utiliser MediaRelay pour partager la piste audio
@@ -449,6 +622,8 @@ class AudioStreamingServer:
             # Créer une offre
             offer = await pc.createOffer()
             await pc.setLocalDescription(offer)
+            if await self.discard_if_draining(admin_sid, pc, self.admin_connections):
+                return
             
             # Envoyer l'offre à l'admin
             await self.sio.emit('webrtc_offer_from_commercial', {
@@ -492,24 +667,106 @@ class AudioStreamingServer:
     def setup_routes(self):
         """Configurer les routes HTTP"""
         self.app.router.add_get('/api/streaming/status', self.get_streaming_status)
+        self.app.router.add_get('/api/streaming/tls', self.get_tls_stats)
         self.app.router.add_get('/health', lambda r: web.json_response({'status': 'ok'}))
 
+    async def get_tls_stats(self, request):
+        """API REST pour obtenir les statistiques des handshakes TLS"""
+        return web.json_response(tls_stats.snapshot())
+
+    def get_certificate_mtimes(self):
+        """Dates de modification du certificat et de la clé (None si illisibles)"""
+        try:
+            return (os.path.getmtime(self.ssl_cert_path), os.path.getmtime(self.ssl_key_path))
+        except OSError:
+            return None
+
+    def build_certificate_context(self) -> ssl.SSLContext:
+        """Contexte portant uniquement le certificat et la clé actuels"""
+        certificate_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        certificate_context.load_cert_chain(self.ssl_cert_path, self.ssl_key_path)
+        return certificate_context
+
+    def select_certificate_context(self, ssl_object, server_name, listening_context):
+        """sni_callback : servir le certificat courant, y compris sans SNI (accès par IP).
+
+        OpenSSL garde le contexte d'écoute comme contexte de session : les tickets
+        et la reprise de session survivent au changement de certificat.
+        """
+        ssl_object.context = self.certificate_context
+
     async def create_ssl_context(self):
         """Créer le contexte SSL pour HTTPS"""
         ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
         try:
-            # Utiliser les mêmes certificats que le serveur Vite
-            import os.path
-            ssl_dir = os.path.join(os.path.dirname(__file__), '..', 'ssl')
-            ssl_context.load_cert_chain(
-                os.path.join(ssl_dir, '192.168.1.50.pem'),
-                os.path.join(ssl_dir, '192.168.1.50-key.pem')
-            )
-            logger.info("✅ Certificats SSL chargés avec succès")
-            return ssl_context
+            ssl_context.load_cert_chain(self.ssl_cert_path, self.ssl_key_path)
+            self.certificate_context = self.build_certificate_context()
+            self.ssl_cert_mtimes = self.get_certificate_mtimes()
+            logger.info(f"✅ Certificats SSL chargés avec succès ({self.ssl_cert_path})")
         except Exception as e:
             logger.error(f"❌ Erreur lors du chargement des certificats SSL: {e}")
             return None
+        
+        # Reprise de session : les mobiles se reconnectent en permanence, un ticket
+        # leur évite un handshake complet. Les clés de tickets vivent dans ce contexte
+        # d'écoute, qui reste le même ; le certificat est choisi à chaque handshake
+        # dans certificate_context (voir reload_certificates).
+        ssl_context.options &= ~ssl.OP_NO_TICKET
+        ssl_context.num_tickets = int(os.getenv('TLS_NUM_TICKETS', '4'))
+        ssl_context.sslobject_class = TrackedSSLObject
+        ssl_context.sni_callback = self.select_certificate_context
+        
+        self.ssl_context = ssl_context
+        return ssl_context
+
+    def reload_certificates(self) -> bool:
+        """Charger le certificat et la clé dans un nouveau contexte de certificat.
+
+        Un contexte neuf est nécessaire : recharger en place ne remplace que
+        l'emplacement du type de clé (RSA, ECDSA...) du nouveau certificat, et
+        l'ancien resterait servi en cas de changement de type. Les connexions
+        établies gardent leur session ; seuls les nouveaux handshakes utilisent
+        le nouveau certificat.
+        """
+        if self.ssl_context is None:
+            return False
+        
+        mtimes = self.get_certificate_mtimes()
+        try:
+            certificate_context = self.build_certificate_context()
+        except Exception as e:
+            logger.error(f"❌ Rechargement des certificats SSL impossible, anciens certificats conservés: {e}")
+            return False
+        
+        self.certificate_context = certificate_context
+        self.ssl_cert_mtimes = mtimes
+        tls_stats.certificate_reloads += 1
+        tls_stats.last_certificate_reload = time.time()
+        logger.info(f"🔄 Certificats SSL rechargés ({self.ssl_cert_path})")
+        return True
+
+    async def watch_certificates(self, interval: float):
+        """Surveiller les fichiers de certificats et les recharger lorsqu'ils changent"""
+        while True:
+            await asyncio.sleep(interval)
+            mtimes = self.get_certificate_mtimes()
+            # En cas d'échec (rotation en cours), ssl_cert_mtimes n'est pas mis à jour
+            # et le rechargement est retenté au prochain passage
+            if mtimes is not None and mtimes != self.ssl_cert_mtimes:
+                self.reload_certificates()
+
+    def setup_certificate_reload(self):
+        """Rechargement des certificats sur SIGHUP et sur modification des fichiers"""
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self.reload_certificates)
+            logger.info("🔐 Rechargement des certificats SSL sur SIGHUP activé")
+        except (AttributeError, NotImplementedError, RuntimeError):
+            logger.warning("⚠️  SIGHUP non disponible, rechargement par signal désactivé")
+        
+        interval = float(os.getenv('SSL_CERT_WATCH_INTERVAL', '30'))
+        if interval > 0:
+            self.certificate_watcher = asyncio.create_task(self.watch_certificates(interval))
 
     async def start_server(self, host='0.0.0.0', http_port=None, https_port=None):
         # Utiliser les variables d'environnement ou les valeurs par défaut
@@ -524,7 +781,8 @@ class AudioStreamingServer:
         logger.info(f"Démarrage des serveurs de streaming audio sur {host}")
         
         # Créer le runner pour l'application
-        runner = web.AppRunner(self.app)
+        # shutdown_timeout : au-delà, aiohttp annule les handlers encore actifs (websockets)
+        runner = web.AppRunner(self.app, shutdown_timeout=self.shutdown_timeout)
         await runner.setup()
         
         # Démarrer le serveur HTTP
@@ -537,19 +795,107 @@ class AudioStreamingServer:
         if ssl_context:
             https_site = web.TCPSite(runner, host, https_port, ssl_context=ssl_context)
             await https_site.start()
+            self.setup_certificate_reload()
             logger.info(f"✅ Serveur HTTPS démarré sur https://{host}:{https_port}")
         else:
             logger.warning("⚠️  Serveur HTTPS non démarré (certificats SSL non disponibles)")
         
-        logger.info("🎵 Serveurs de streaming audio prêts !")
+        stop_event = asyncio.Event()
+        self.setup_shutdown_signals(stop_event)
+        
+        time_to_ready = time.perf_counter() - MODULE_LOADED_AT
+        # 'uvloop' ou 'asyncio', d'après le module de la boucle en cours
+        event_loop_name = type(asyncio.get_running_loop()).__module__.split('.')[0]
+        logger.info(f"🎵 Serveurs de streaming audio prêts en {time_to_ready:.2f}s après le chargement du module (boucle {event_loop_name}) !")
+        
+        # Garder les serveurs en vie jusqu'à SIGTERM/SIGINT
+        try:
+            await stop_event.wait()
+        finally:
+            await self.shutdown(runner)
+
+    def setup_shutdown_signals(self, stop_event: asyncio.Event):
+        """Déclencher l'arrêt propre sur SIGTERM (déploiement) et SIGINT (Ctrl+C)"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                # Windows : KeyboardInterrupt annule la tâche et le bloc finally fait l'arrêt
+                logger.warning(f"⚠️  Impossible d'intercepter {sig.name}, arrêt propre non garanti")
+
+    async def shutdown(self, runner: web.AppRunner):
+        """Arrêt propre : refuser les nouvelles sessions, prévenir les clients,
+        fermer les RTCPeerConnection puis le serveur web, le tout dans SHUTDOWN_TIMEOUT secondes"""
+        started = time.perf_counter()
+        deadline = started + self.shutdown_timeout
+        
+        def remaining():
+            return max(deadline - time.perf_counter(), 0.1)
+        
+        self.draining = True
+        logger.info(f"🛑 Arrêt des serveurs... ({len(self.commercial_connections) + len(self.admin_connections)} connexion(s) WebRTC ouverte(s))")
+        
+        # Fermer les sockets d'écoute : les reconnexions automatiques des clients
+        # ne doivent pas rouvrir de sessions pendant la vidange
+        for site in list(runner.sites):
+            await site.stop()
+        
+        if self.certificate_watcher:
+            self.certificate_watcher.cancel()
         
-        # Garder les serveurs en vie
         try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("🛑 Arrêt des serveurs...")
-            await runner.cleanup()
+            await asyncio.wait_for(self.sio.emit('server_shutdown', {
+                'message': 'Serveur en cours de redémarrage, reconnexion nécessaire'
+            }), timeout=remaining())
+        except Exception as e:
+            logger.warning(f"⚠️  Notification d'arrêt incomplète: {e!r}")
+        
+        # Des négociations commencées avant l'arrêt peuvent encore ajouter des connexions
+        # pendant les attentes : fermer par vagues jusqu'à ce qu'il n'en reste plus
+        closed = set()
+        while time.perf_counter() < deadline:
+            peer_connections = [
+                pc for pc in list(self.commercial_connections.values()) + list(self.admin_connections.values())
+                if pc not in closed
+            ]
+            if not peer_connections:
+                break
+            closed.update(peer_connections)
+            try:
+                results = await asyncio.wait_for(
+                    asyncio.gather(*(pc.close() for pc in peer_connections), return_exceptions=True),
+                    timeout=remaining()
+                )
+            except asyncio.TimeoutError:
+                logger.warning("⚠️  Délai dépassé pendant la fermeture des connexions WebRTC")
+                break
+            for error in (r for r in results if isinstance(r, Exception)):
+                logger.error(f"Erreur lors de la fermeture d'une connexion WebRTC: {error}")
+        
+        for connections in (self.commercial_connections, self.admin_connections):
+            for sid, pc in list(connections.items()):
+                if pc in closed:
+                    connections.pop(sid, None)
+        if self.commercial_connections or self.admin_connections:
+            logger.warning(f"⚠️  {len(self.commercial_connections) + len(self.admin_connections)} connexion(s) WebRTC non fermée(s) avant le délai")
+        logger.info(f"{len(closed)} connexion(s) WebRTC fermée(s)")
+        self.commercial_audio_tracks.clear()
+        
+        # Fermer les sockets Socket.IO pour que runner.cleanup() n'attende pas leurs handlers
+        if self.sio.eio.sockets:
+            try:
+                await asyncio.wait_for(self.sio.eio.disconnect(), timeout=remaining())
+            except Exception as e:
+                logger.warning(f"⚠️  Déconnexion des clients Socket.IO incomplète: {e!r}")
+        
+        try:
+            await asyncio.wait_for(runner.cleanup(), timeout=remaining())
+        except asyncio.TimeoutError:
+            logger.warning("⚠️  Délai dépassé pendant l'arrêt du serveur web")
+        
+        logger.info(f"✅ Serveurs arrêtés en {time.perf_counter() - started:.2f}s")
+        logger.info(f"🔐 Statistiques TLS: {tls_stats.snapshot()}")
 
 async def main():
     """Point d'entrée principal"""
@@ -557,6 +903,7 @@ async def main():
     await server.start_server()
 
 if __name__ == '__main__':
+    install_event_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
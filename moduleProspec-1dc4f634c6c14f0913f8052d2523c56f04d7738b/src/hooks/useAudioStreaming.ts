@@ -173,6 +173,27 @@ export const useAudioStreaming = (config: AudioStreamingConfig): AudioStreamingH
     return pc;
   }, [config.userRole]);
 
+  // Fermer la connexion WebRTC, couper le micro et l'audio distant
+  const resetMedia = useCallback(() => {
+    if (peerConnectionRef.current) {
+      peerConnectionRef.current.close();
+      peerConnectionRef.current = null;
+    }
+
+    if (localStreamRef.current) {
+      localStreamRef.current.getTracks().forEach(track => track.stop());
+      localStreamRef.current = null;
+    }
+
+    if (remoteAudioRef.current) {
+      remoteAudioRef.current.srcObject = null;
+    }
+
+    setIsListening(false);
+    setIsStreaming(false);
+    setCurrentListeningTo(null);
+  }, []);
+
   const connect = useCallback(async () => {
     console.log('🔌 AUDIO STREAMING - Connect appelé');
     console.log('🔌 AUDIO STREAMING - Server URL:', config.serverUrl);
@@ -221,6 +242,12 @@ export const useAudioStreaming = (config: AudioStreamingConfig): AudioStreamingH
         setError(data.message);
       });
 
+      socket.on('server_shutdown', (data) => {
+        console.warn('🛑 Arrêt du serveur de streaming audio:', data.message);
+        setError(data.message);
+        resetMedia();
+      });
+
       socket.on('connect_error', (error) => {
         console.error('❌ Erreur de connexion socket:', error);
         console.error('❌ Erreur details:', error);
@@ -399,7 +426,7 @@ export const useAudioStreaming = (config: AudioStreamingConfig): AudioStreamingH
       console.error('Erreur connexion serveur streaming:', error);
       setError('Impossible de se connecter au serveur de streaming');
     }
-  }, [config.serverUrl, config.userRole, createPeerConnection, currentListeningTo]);
+  }, [config.serverUrl, config.userRole, createPeerConnection, currentListeningTo, resetMedia]);
 
   const disconnect = useCallback(() => {
     if (socketRef.current) {
@@ -407,25 +434,9 @@ export const useAudioStreaming = (config: AudioStreamingConfig): AudioStreamingH
       socketRef.current = null;
     }
 
-    if (peerConnectionRef.current) {
-      peerConnectionRef.current.close();
-      peerConnectionRef.current = null;
-    }
-
-    if (localStreamRef.current) {
-      localStreamRef.current.getTracks().forEach(track => track.stop());
-      localStreamRef.current = null;
-    }
-
-    if (remoteAudioRef.current) {
-      remoteAudioRef.current.srcObject = null;
-    }
-
+    resetMedia();
     setIsConnected(false);
-    setIsListening(false);
-    setIsStreaming(false);
-    setCurrentListeningTo(null);
-  }, []);
+  }, [resetMedia]);
 
   // Actions pour les admins
   const startListening = useCallback(async (commercialId: string) => {